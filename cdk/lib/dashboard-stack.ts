@@ -258,12 +258,17 @@ export class OpenSearchDashboardStack extends cdk.Stack {
     openSearchUI.node.addDependency(domainReadyWaiter);
 
     // Step 4: Create Lambda Function for Dashboard Setup
+    // Bundle for the function's architecture so compiled wheels (orjson) match
+    // the runtime, whatever the architecture of the machine running cdk
+    const dashboardFnArchitecture = lambda.Architecture.X86_64;
     const dashboardFn = new lambda.Function(this, 'DashboardSetup', {
       runtime: lambda.Runtime.PYTHON_3_11,
+      architecture: dashboardFnArchitecture,
       handler: 'dashboard_automation.handler',
       code: lambda.Code.fromAsset('../lambda', {
         bundling: {
           image: lambda.Runtime.PYTHON_3_11.bundlingImage,
+          platform: dashboardFnArchitecture.dockerPlatform,
           command: [
             'bash', '-c',
             'pip install -r requirements.txt -t /asset-output && cp -r *.py /asset-output/'
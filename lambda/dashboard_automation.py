@@ -3,10 +3,14 @@ OpenSearch Dashboard Automation Handler
 Automates workspace creation and dashboard setup via OpenSearch UI API
 """
 
-import json
 import logging
 import time
-from typing import Any, Dict, Optional
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import quote
+
+import orjson
 
 from sigv4_signer import get_common_headers, make_signed_request, make_domain_request
 
@@ -14,23 +18,63 @@ from sigv4_signer import get_common_headers, make_signed_request, make_domain_re
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+# Worker threads for overlapping independent API calls (all network-bound);
+# at most two calls are in flight at once
+MAX_WORKERS = 2
+
+# Data source IDs by (UI endpoint, domain name); persists across warm invocations
+_DATA_SOURCE_CACHE: Dict[Tuple[str, str], str] = {}
+
+# Placeholders for the IDs substituted into pre-serialized request bodies
+_DATA_SOURCE_ID = "__DATA_SOURCE_ID__"
+_INDEX_PATTERN_ID = "__INDEX_PATTERN_ID__"
+_VISUALIZATION_ID = "__VISUALIZATION_ID__"
+_DASHBOARD_ID = "__DASHBOARD_ID__"
+
+# Index pattern ID inside searchSourceJSON, a JSON string nested in the body
+_NESTED_INDEX_PATTERN_ID = "__NESTED_INDEX_PATTERN_ID__"
+
+
+def _render(template: bytes, placeholder: str, value: str, depth: int = 1) -> bytes:
+    """
+    Substitute an ID into a pre-serialized request body.
+    
+    The value is JSON-string escaped once per level of string nesting the
+    placeholder sits in (depth=2 for IDs inside embedded JSON strings).
+    """
+    escaped = value
+    for _ in range(depth):
+        escaped = orjson.dumps(escaped)[1:-1].decode("utf-8")
+    return template.replace(placeholder.encode("utf-8"), escaped.encode("utf-8"))
+
 
 def get_data_source_id(endpoint: str, region: str, domain_name: str) -> Optional[str]:
     """
     Retrieve data source ID by searching for the domain name.
     
     OpenSearch UI automatically creates a data source for connected domains.
-    This function finds that data source ID.
+    This function finds that data source ID. Results are cached for the
+    lifetime of the Lambda container.
     """
-    logger.info(f"Searching for data source: {domain_name}")
-    url = f"https://{endpoint}/api/saved_objects/_find?type=data-source&per_page=100"
+    cached_id = _DATA_SOURCE_CACHE.get((endpoint, domain_name))
+    if cached_id:
+        logger.info("Using cached data source: %s", cached_id)
+        return cached_id
+    
+    logger.info("Searching for data source: %s", domain_name)
+    # Filter by title server-side so only candidate data sources are returned
+    search = quote(f'"{domain_name}"', safe="")
+    url = (
+        f"https://{endpoint}/api/saved_objects/_find"
+        f"?type=data-source&search_fields=title&search={search}&per_page=10"
+    )
     headers = get_common_headers()
     
     try:
         response = make_signed_request("GET", url, headers, region=region)
         
         if 200 <= response.status_code < 300:
-            data = json.loads(response.text)
+            data = orjson.loads(response.content)
             saved_objects = data.get("saved_objects", [])
             
             # Find data source matching domain name
@@ -38,23 +82,25 @@ def get_data_source_id(endpoint: str, region: str, domain_name: str) -> Optional
                 title = obj.get("attributes", {}).get("title", "")
                 if domain_name in title or title == domain_name:
                     data_source_id = obj.get("id")
-                    logger.info(f"Found data source: {data_source_id}")
+                    logger.info("Found data source: %s", data_source_id)
+                    if data_source_id:
+                        _DATA_SOURCE_CACHE[(endpoint, domain_name)] = data_source_id
                     return data_source_id
             
-            logger.warning(f"No data source found for domain: {domain_name}")
+            logger.warning("No data source found for domain: %s", domain_name)
             return None
         else:
-            logger.error(f"Failed to retrieve data sources: HTTP {response.status_code} - {response.text}")
+            logger.error("Failed to retrieve data sources: HTTP %s - %s", response.status_code, response.text)
             return None
             
     except Exception as e:
-        logger.error(f"Exception getting data source: {str(e)}", exc_info=True)
+        logger.error("Exception getting data source: %s", e)
         return None
 
 
 def find_workspace_by_name(endpoint: str, region: str, workspace_name: str) -> Optional[str]:
     """Find workspace ID by workspace name."""
-    logger.info(f"Searching for workspace: {workspace_name}")
+    logger.info("Searching for workspace: %s", workspace_name)
     url = f"https://{endpoint}/api/workspaces/_list"
     headers = get_common_headers()
     
@@ -62,7 +108,7 @@ def find_workspace_by_name(endpoint: str, region: str, workspace_name: str) -> O
         response = make_signed_request("POST", url, headers, b"{}", region=region)
         
         if 200 <= response.status_code < 300:
-            data = json.loads(response.text)
+            data = orjson.loads(response.content)
             
             if not data.get("success"):
                 logger.error("API returned success=false when listing workspaces")
@@ -73,17 +119,17 @@ def find_workspace_by_name(endpoint: str, region: str, workspace_name: str) -> O
             for workspace in workspaces:
                 if workspace.get("name") == workspace_name:
                     workspace_id = workspace.get("id")
-                    logger.info(f"Found existing workspace: {workspace_id}")
+                    logger.info("Found existing workspace: %s", workspace_id)
                     return workspace_id
             
-            logger.info(f"Workspace '{workspace_name}' not found")
+            logger.info("Workspace '%s' not found", workspace_name)
             return None
         else:
-            logger.error(f"Failed to list workspaces: HTTP {response.status_code} - {response.text}")
+            logger.error("Failed to list workspaces: HTTP %s - %s", response.status_code, response.text)
             return None
             
     except Exception as e:
-        logger.error(f"Exception listing workspaces: {str(e)}", exc_info=True)
+        logger.error("Exception listing workspaces: %s", e)
         return None
 
 
@@ -91,7 +137,7 @@ def create_workspace(
     endpoint: str, region: str, data_source_id: str, workspace_name: str
 ) -> Optional[str]:
     """Create workspace via OpenSearch UI API."""
-    logger.info(f"Creating workspace: {workspace_name}")
+    logger.info("Creating workspace: %s", workspace_name)
     url = f"https://{endpoint}/api/workspaces"
     
     request_body = {
@@ -110,33 +156,33 @@ def create_workspace(
         },
     }
     
-    body_bytes = json.dumps(request_body).encode("utf-8")
+    body_bytes = orjson.dumps(request_body)
     headers = get_common_headers(body_bytes)
     
     try:
         response = make_signed_request("POST", url, headers, body_bytes, region=region)
         
         if 200 <= response.status_code < 300:
-            response_data = json.loads(response.text)
+            response_data = orjson.loads(response.content)
             
             if not response_data.get("success"):
-                logger.error(f"API returned success=false - {response.text}")
+                logger.error("API returned success=false - %s", response.text)
                 return None
             
             workspace_id = response_data.get("result", {}).get("id")
             
             if workspace_id:
-                logger.info(f"Workspace created: {workspace_id}")
+                logger.info("Workspace created: %s", workspace_id)
             else:
                 logger.error("No workspace ID in response")
             
             return workspace_id
         else:
-            logger.error(f"Failed to create workspace: HTTP {response.status_code} - {response.text}")
+            logger.error("Failed to create workspace: HTTP %s - %s", response.status_code, response.text)
             return None
             
     except Exception as e:
-        logger.error(f"Exception creating workspace: {str(e)}", exc_info=True)
+        logger.error("Exception creating workspace: %s", e)
         return None
 
 
@@ -146,17 +192,17 @@ def get_or_create_workspace(
     """
     Get existing workspace by name, or create if it doesn't exist (idempotent).
     """
-    logger.info(f"Getting or creating workspace: {workspace_name}")
+    logger.info("Getting or creating workspace: %s", workspace_name)
     
     # Check if workspace exists
     workspace_id = find_workspace_by_name(endpoint, region, workspace_name)
     
     if workspace_id:
-        logger.info(f"Reusing existing workspace: {workspace_id}")
+        logger.info("Reusing existing workspace: %s", workspace_id)
         return workspace_id
     
     # Create new workspace
-    logger.info(f"Creating new workspace: {workspace_name}")
+    logger.info("Creating new workspace: %s", workspace_name)
     return create_workspace(endpoint, region, data_source_id, workspace_name)
 
 
@@ -174,7 +220,7 @@ def generate_sample_metrics(num_docs: int = 50) -> list:
     import random
     from datetime import datetime, timedelta
     
-    logger.info(f"Generating {num_docs} sample metrics")
+    logger.info("Generating %s sample metrics", num_docs)
     
     # Configuration for realistic data
     endpoints = [
@@ -189,30 +235,24 @@ def generate_sample_metrics(num_docs: int = 50) -> list:
     status_codes = [200, 201, 400, 404, 500]
     status_weights = [0.70, 0.15, 0.08, 0.05, 0.02]  # Most requests succeed
     
+    # Draw every field for all documents up front rather than per document.
+    # Offsets are sorted descending so timestamps come out oldest first.
+    hours_ago = sorted((random.uniform(0, 24) for _ in range(num_docs)), reverse=True)
+    doc_endpoints = random.choices(endpoints, k=num_docs)
+    doc_methods = random.choices(http_methods, k=num_docs)
+    doc_status_codes = random.choices(status_codes, weights=status_weights, k=num_docs)
+    
+    # Response time based on status (errors are faster)
+    response_times = [
+        random.randint(10, 100) if status_code >= 400 else random.randint(20, 500)
+        for status_code in doc_status_codes
+    ]
+    
     # Generate documents spread over last 24 hours
     now = datetime.utcnow()
-    documents = []
-    
-    for i in range(num_docs):
-        # Random timestamp in last 24 hours
-        hours_ago = random.uniform(0, 24)
-        timestamp = now - timedelta(hours=hours_ago)
-        
-        # Select endpoint and method
-        endpoint = random.choice(endpoints)
-        method = random.choice(http_methods)
-        
-        # Status code with realistic distribution
-        status_code = random.choices(status_codes, weights=status_weights)[0]
-        
-        # Response time based on status (errors are faster)
-        if status_code >= 400:
-            response_time = random.randint(10, 100)
-        else:
-            response_time = random.randint(20, 500)
-        
-        doc = {
-            "@timestamp": timestamp.strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
+    documents = [
+        {
+            "@timestamp": (now - timedelta(hours=hours)).isoformat(timespec="microseconds") + "Z",
             "service": "api-gateway",
             "endpoint": endpoint,
             "http_method": method,
@@ -221,13 +261,12 @@ def generate_sample_metrics(num_docs: int = 50) -> list:
             "region": "us-west-2",
             "success": status_code < 400
         }
-        
-        documents.append(doc)
-    
-    # Sort by timestamp (oldest first)
-    documents.sort(key=lambda x: x["@timestamp"])
+        for hours, endpoint, method, status_code, response_time in zip(
+            hours_ago, doc_endpoints, doc_methods, doc_status_codes, response_times
+        )
+    ]
     
-    logger.info(f"Generated {len(documents)} documents")
+    logger.info("Generated %s documents", len(documents))
     return documents
 
 
@@ -249,51 +288,75 @@ def ingest_sample_data(
     """
     from datetime import datetime
     index_name = f"application-metrics-{datetime.utcnow().strftime('%Y.%m.%d')}"
-    logger.info(f"Ingesting {len(documents)} documents to index: {index_name}")
+    logger.info("Ingesting %s documents to index: %s", len(documents), index_name)
     
-    # Build bulk request body
+    # Build bulk request body in a single buffer
     # Format: {"index": {"_index": "index-name"}}\n{document}\n
-    bulk_body_lines = []
+    index_line = orjson.dumps({"index": {"_index": index_name}}) + b"\n"
+    bulk_body = bytearray()
+    append = bulk_body.extend
     for doc in documents:
-        bulk_body_lines.append(json.dumps({"index": {"_index": index_name}}))
-        bulk_body_lines.append(json.dumps(doc))
+        append(index_line)
+        append(orjson.dumps(doc))
+        append(b"\n")
     
-    bulk_body = "\n".join(bulk_body_lines) + "\n"
-    body_bytes = bulk_body.encode("utf-8")
+    body_bytes = bytes(bulk_body)
     
     # Make request directly to OpenSearch domain bulk endpoint
     # Uses 'es' service name for SigV4 signing (not 'opensearch')
-    url = f"https://{domain_endpoint}/_bulk"
+    # filter_path trims the response to failed items instead of one per document
+    filter_path = quote("errors,items.*.error", safe="")
+    url = f"https://{domain_endpoint}/_bulk?filter_path={filter_path}"
     headers = {"Content-Type": "application/x-ndjson"}
     
     try:
         response = make_domain_request("POST", url, headers, body_bytes, region=region)
         
         if 200 <= response.status_code < 300:
-            response_data = json.loads(response.text)
+            response_data = orjson.loads(response.content)
             
-            # Check for errors in bulk response
+            # Check for errors in bulk response (only failed items are returned)
+            error_count = 0
             if response_data.get("errors"):
-                error_count = sum(1 for item in response_data.get("items", []) 
-                                if "error" in item.get("index", {}))
-                logger.warning(f"Bulk ingestion had {error_count} errors")
+                failed_items = [item for item in response_data.get("items", [])
+                                if "error" in item.get("index", {})]
+                error_count = len(failed_items)
+                logger.warning("Bulk ingestion had %s errors", error_count)
                 # Log first error for debugging
-                for item in response_data.get("items", [])[:1]:
-                    if "error" in item.get("index", {}):
-                        logger.error(f"Sample error: {item['index']['error']}")
+                if failed_items:
+                    logger.error("Sample error: %s", failed_items[0]['index']['error'])
             
-            success_count = len(documents) - response_data.get("errors", 0)
-            logger.info(f"Ingested {success_count}/{len(documents)} documents to {index_name}")
+            success_count = len(documents) - error_count
+            logger.info("Ingested %s/%s documents to %s", success_count, len(documents), index_name)
             return True
         else:
-            logger.error(f"Bulk ingest failed: HTTP {response.status_code} - {response.text}")
+            logger.error("Bulk ingest failed: HTTP %s - %s", response.status_code, response.text)
             return False
             
     except Exception as e:
-        logger.error(f"Exception during bulk ingest: {str(e)}", exc_info=True)
+        logger.error("Exception during bulk ingest: %s", e)
         return False
 
 
+# Request bodies below are fixed apart from the referenced IDs, so they are
+# serialized once at import and only the IDs are substituted per call
+_INDEX_PATTERN_OBJECT = {
+    "attributes": {
+        "title": "application-metrics-*",
+        "timeFieldName": "@timestamp"
+    },
+    "references": [
+        {
+            "id": _DATA_SOURCE_ID,
+            "type": "data-source",
+            "name": "dataSource"
+        }
+    ]
+}
+
+_INDEX_PATTERN_BODY = orjson.dumps(_INDEX_PATTERN_OBJECT)
+
+
 def create_index_pattern(
     endpoint: str,
     region: str,
@@ -315,40 +378,86 @@ def create_index_pattern(
     """
     logger.info("Creating index pattern: application-metrics-*")
     url = f"https://{endpoint}/w/{workspace_id}/api/saved_objects/index-pattern"
-    request_body = {
-        "attributes": {
-            "title": "application-metrics-*",
-            "timeFieldName": "@timestamp"
-        },
-        "references": [
-            {
-                "id": data_source_id,
-                "type": "data-source",
-                "name": "dataSource"
-            }
-        ]
-    }
-    
-    body_bytes = json.dumps(request_body).encode("utf-8")
+    body_bytes = _render(_INDEX_PATTERN_BODY, _DATA_SOURCE_ID, data_source_id)
     headers = get_common_headers(body_bytes)
     
     try:
         response = make_signed_request("POST", url, headers, body_bytes, region=region)
         
         if 200 <= response.status_code < 300:
-            response_data = json.loads(response.text)
+            response_data = orjson.loads(response.content)
             index_pattern_id = response_data.get("id")
-            logger.info(f"Index pattern created: {index_pattern_id}")
+            logger.info("Index pattern created: %s", index_pattern_id)
             return index_pattern_id
         else:
-            logger.error(f"Failed to create index pattern: HTTP {response.status_code} - {response.text}")
+            logger.error("Failed to create index pattern: HTTP %s - %s", response.status_code, response.text)
             return None
             
     except Exception as e:
-        logger.error(f"Exception creating index pattern: {str(e)}", exc_info=True)
+        logger.error("Exception creating index pattern: %s", e)
         return None
 
 
+# Pie chart showing status code distribution
+_VIS_STATE = {
+    "title": "HTTP Status Code Distribution",
+    "type": "pie",
+    "params": {
+        "type": "pie",
+        "addTooltip": True,
+        "addLegend": True,
+        "legendPosition": "right",
+        "isDonut": False,
+        "labels": {
+            "show": True,
+            "values": True,
+            "last_level": True,
+            "truncate": 100
+        }
+    },
+    "aggs": [
+        {
+            "id": "1",
+            "enabled": True,
+            "type": "count",
+            "schema": "metric",
+            "params": {}
+        },
+        {
+            "id": "2",
+            "enabled": True,
+            "type": "terms",
+            "schema": "segment",
+            "params": {
+                "field": "status_code",
+                "size": 10,
+                "order": "desc",
+                "orderBy": "1"
+            }
+        }
+    ]
+}
+
+_VISUALIZATION_OBJECT = {
+    "attributes": {
+        "title": "HTTP Status Code Distribution",
+        "visState": orjson.dumps(_VIS_STATE).decode(),
+        "uiStateJSON": "{}",
+        "description": "Pie chart showing distribution of HTTP status codes",
+        "version": 1,
+        "kibanaSavedObjectMeta": {
+            "searchSourceJSON": orjson.dumps({
+                "index": _NESTED_INDEX_PATTERN_ID,
+                "query": {"query": "", "language": "kuery"},
+                "filter": []
+            }).decode()
+        }
+    }
+}
+
+_VISUALIZATION_BODY = orjson.dumps(_VISUALIZATION_OBJECT)
+
+
 def create_visualization(
     endpoint: str,
     region: str,
@@ -370,83 +479,63 @@ def create_visualization(
     logger.info("Creating pie chart visualization for status codes")
     url = f"https://{endpoint}/w/{workspace_id}/api/saved_objects/visualization"
     
-    # Pie chart showing status code distribution
-    vis_state = {
-        "title": "HTTP Status Code Distribution",
-        "type": "pie",
-        "params": {
-            "type": "pie",
-            "addTooltip": True,
-            "addLegend": True,
-            "legendPosition": "right",
-            "isDonut": False,
-            "labels": {
-                "show": True,
-                "values": True,
-                "last_level": True,
-                "truncate": 100
-            }
-        },
-        "aggs": [
-            {
-                "id": "1",
-                "enabled": True,
-                "type": "count",
-                "schema": "metric",
-                "params": {}
-            },
-            {
-                "id": "2",
-                "enabled": True,
-                "type": "terms",
-                "schema": "segment",
-                "params": {
-                    "field": "status_code",
-                    "size": 10,
-                    "order": "desc",
-                    "orderBy": "1"
-                }
-            }
-        ]
-    }
-    
-    request_body = {
-        "attributes": {
-            "title": "HTTP Status Code Distribution",
-            "visState": json.dumps(vis_state),
-            "uiStateJSON": "{}",
-            "description": "Pie chart showing distribution of HTTP status codes",
-            "version": 1,
-            "kibanaSavedObjectMeta": {
-                "searchSourceJSON": json.dumps({
-                    "index": index_pattern_id,
-                    "query": {"query": "", "language": "kuery"},
-                    "filter": []
-                })
-            }
-        }
-    }
-    
-    body_bytes = json.dumps(request_body).encode("utf-8")
+    body_bytes = _render(
+        _VISUALIZATION_BODY, _NESTED_INDEX_PATTERN_ID, index_pattern_id, depth=2
+    )
     headers = get_common_headers(body_bytes)
     
     try:
         response = make_signed_request("POST", url, headers, body_bytes, region=region)
         
         if 200 <= response.status_code < 300:
-            response_data = json.loads(response.text)
+            response_data = orjson.loads(response.content)
             vis_id = response_data.get("id")
-            logger.info(f"Visualization created: {vis_id}")
+            logger.info("Visualization created: %s", vis_id)
             return vis_id
         else:
-            logger.error(f"Failed to create visualization: HTTP {response.status_code} - {response.text}")
+            logger.error("Failed to create visualization: HTTP %s - %s", response.status_code, response.text)
             return None
             
     except Exception as e:
-        logger.error(f"Exception creating visualization: {str(e)}", exc_info=True)
+        logger.error("Exception creating visualization: %s", e)
         return None
 
 
+# Single panel layout
+_DASHBOARD_PANELS = [
+    {
+        "version": "2.11.0",
+        "gridData": {"x": 0, "y": 0, "w": 24, "h": 15, "i": "1"},
+        "panelIndex": "1",
+        "embeddableConfig": {},
+        "panelRefName": "panel_0"
+    }
+]
+
+_DASHBOARD_OBJECT = {
+    "attributes": {
+        "title": "Application Metrics",
+        "hits": 0,
+        "description": "Simple dashboard showing API metrics",
+        "panelsJSON": orjson.dumps(_DASHBOARD_PANELS).decode(),
+        "optionsJSON": orjson.dumps({"useMargins": True, "hidePanelTitles": False}).decode(),
+        "version": 1,
+        "timeRestore": False,
+        "kibanaSavedObjectMeta": {
+            "searchSourceJSON": orjson.dumps({
+                "query": {"query": "", "language": "kuery"},
+                "filter": []
+            }).decode()
+        }
+    },
+    "references": [
+        {"name": "panel_0", "type": "visualization", "id": _VISUALIZATION_ID}
+    ]
+}
+
+_DASHBOARD_BODY = orjson.dumps(_DASHBOARD_OBJECT)
+
+
 def create_dashboard(
     endpoint: str,
     region: str,
@@ -468,56 +557,122 @@ def create_dashboard(
     logger.info("Creating dashboard with visualization")
     url = f"https://{endpoint}/w/{workspace_id}/api/saved_objects/dashboard"
     
-    # Single panel layout
-    panels = [
-        {
-            "version": "2.11.0",
-            "gridData": {"x": 0, "y": 0, "w": 24, "h": 15, "i": "1"},
-            "panelIndex": "1",
-            "embeddableConfig": {},
-            "panelRefName": "panel_0"
-        }
-    ]
+    body_bytes = _render(_DASHBOARD_BODY, _VISUALIZATION_ID, visualization_id)
+    headers = get_common_headers(body_bytes)
     
-    request_body = {
-        "attributes": {
-            "title": "Application Metrics",
-            "hits": 0,
-            "description": "Simple dashboard showing API metrics",
-            "panelsJSON": json.dumps(panels),
-            "optionsJSON": json.dumps({"useMargins": True, "hidePanelTitles": False}),
-            "version": 1,
-            "timeRestore": False,
-            "kibanaSavedObjectMeta": {
-                "searchSourceJSON": json.dumps({
-                    "query": {"query": "", "language": "kuery"},
-                    "filter": []
-                })
-            }
-        },
-        "references": [
-            {"name": "panel_0", "type": "visualization", "id": visualization_id}
-        ]
-    }
+    try:
+        response = make_signed_request("POST", url, headers, body_bytes, region=region)
+        
+        if 200 <= response.status_code < 300:
+            response_data = orjson.loads(response.content)
+            dashboard_id = response_data.get("id")
+            logger.info("Dashboard created: %s", dashboard_id)
+            return dashboard_id
+        else:
+            logger.error("Failed to create dashboard: HTTP %s - %s", response.status_code, response.text)
+            return None
+            
+    except Exception as e:
+        logger.error("Exception creating dashboard: %s", e)
+        return None
+
+
+# All three saved objects in one _bulk_create request, with client-assigned
+# IDs so the visualization and dashboard can reference their dependencies
+_BULK_CREATE_BODY = orjson.dumps([
+    {"type": "index-pattern", "id": _INDEX_PATTERN_ID, **_INDEX_PATTERN_OBJECT},
+    {"type": "visualization", "id": _VISUALIZATION_ID, **_VISUALIZATION_OBJECT},
+    {"type": "dashboard", "id": _DASHBOARD_ID, **_DASHBOARD_OBJECT},
+])
+
+
+def create_dashboard_objects(
+    endpoint: str,
+    region: str,
+    workspace_id: str,
+    data_source_id: str
+) -> Optional[str]:
+    """
+    Create the index pattern, visualization, and dashboard in one request.
+    
+    Uses the saved objects _bulk_create API with pre-assigned IDs. Falls back
+    to creating the objects one at a time if the endpoint is not available.
+    
+    Args:
+        endpoint: OpenSearch UI endpoint
+        region: AWS region
+        workspace_id: Workspace ID
+        data_source_id: Data source ID to reference
     
-    body_bytes = json.dumps(request_body).encode("utf-8")
+    Returns:
+        Dashboard ID if successful, None otherwise
+    """
+    logger.info("Creating index pattern, visualization, and dashboard")
+    url = f"https://{endpoint}/w/{workspace_id}/api/saved_objects/_bulk_create"
+    
+    index_pattern_id = str(uuid.uuid4())
+    dashboard_id = str(uuid.uuid4())
+    body_bytes = _BULK_CREATE_BODY
+    for placeholder, value, depth in (
+        (_DATA_SOURCE_ID, data_source_id, 1),
+        (_INDEX_PATTERN_ID, index_pattern_id, 1),
+        (_NESTED_INDEX_PATTERN_ID, index_pattern_id, 2),
+        (_VISUALIZATION_ID, str(uuid.uuid4()), 1),
+        (_DASHBOARD_ID, dashboard_id, 1),
+    ):
+        body_bytes = _render(body_bytes, placeholder, value, depth)
     headers = get_common_headers(body_bytes)
     
     try:
         response = make_signed_request("POST", url, headers, body_bytes, region=region)
         
+        if response.status_code == 404:
+            logger.info("Bulk create not available, creating saved objects individually")
+            return _create_dashboard_objects_individually(
+                endpoint, region, workspace_id, data_source_id
+            )
+        
         if 200 <= response.status_code < 300:
-            response_data = json.loads(response.text)
-            dashboard_id = response_data.get("id")
-            logger.info(f"Dashboard created: {dashboard_id}")
+            response_data = orjson.loads(response.content)
+            
+            # Errors are reported per object in an otherwise successful response
+            failed = False
+            for obj in response_data.get("saved_objects", []):
+                if "error" in obj:
+                    failed = True
+                    logger.error("Failed to create %s: %s", obj.get("type"), obj["error"])
+            if failed:
+                return None
+            
+            logger.info("Dashboard created: %s", dashboard_id)
             return dashboard_id
         else:
-            logger.error(f"Failed to create dashboard: HTTP {response.status_code} - {response.text}")
+            logger.error("Failed to bulk create saved objects: HTTP %s - %s", response.status_code, response.text)
             return None
             
     except Exception as e:
-        logger.error(f"Exception creating dashboard: {str(e)}", exc_info=True)
+        logger.error("Exception bulk creating saved objects: %s", e)
+        return None
+
+
+def _create_dashboard_objects_individually(
+    endpoint: str,
+    region: str,
+    workspace_id: str,
+    data_source_id: str
+) -> Optional[str]:
+    """Create the index pattern, visualization, and dashboard one at a time."""
+    index_pattern_id = create_index_pattern(endpoint, region, workspace_id, data_source_id)
+    if not index_pattern_id:
+        logger.warning("Index pattern creation failed, skipping visualization and dashboard")
+        return None
+    
+    visualization_id = create_visualization(endpoint, region, workspace_id, index_pattern_id)
+    if not visualization_id:
+        logger.warning("Visualization creation failed, skipping dashboard")
         return None
+    
+    return create_dashboard(endpoint, region, workspace_id, visualization_id)
 
 
 def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
@@ -539,7 +694,7 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     workspace_name = properties.get("workspaceName")
     region = properties.get("region")
     
-    logger.info(f"Request: {request_type} | Domain: {domain_name} | Workspace: {workspace_name} | Region: {region}")
+    logger.info("Request: %s | Domain: %s | Workspace: %s | Region: %s", request_type, domain_name, workspace_name, region)
     
     # Handle delete requests
     if request_type == "Delete":
@@ -553,49 +708,51 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     
     # Handle create/update requests
     try:
-        # Get data source ID for the OpenSearch domain
-        data_source_id = get_data_source_id(opensearch_ui_endpoint, region, domain_name)
-        if not data_source_id:
-            raise RuntimeError(f"Data source not found for domain: {domain_name}")
-        
-        # Create workspace with data source (idempotent)
-        workspace_id = get_or_create_workspace(
-            opensearch_ui_endpoint, region, data_source_id, workspace_name
-        )
-        if not workspace_id:
-            raise RuntimeError("Failed to get or create workspace")
-        
-        # Generate and ingest sample data
         domain_endpoint = properties.get("domainEndpoint")
-        sample_documents = []
-        if not domain_endpoint:
-            logger.warning("Domain endpoint not provided, skipping sample data ingestion")
-        else:
-            sample_documents = generate_sample_metrics(num_docs=50)
-            ingest_success = ingest_sample_data(domain_endpoint, region, sample_documents)
-            if not ingest_success:
-                logger.warning("Sample data ingestion failed, but continuing")
         
-        # Create index pattern, visualization, and dashboard
-        index_pattern_id = create_index_pattern(
-            opensearch_ui_endpoint, region, workspace_id, data_source_id
-        )
-        if not index_pattern_id:
-            logger.warning("Index pattern creation failed, skipping visualization and dashboard")
-        else:
-            visualization_id = create_visualization(
-                opensearch_ui_endpoint, region, workspace_id, index_pattern_id
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            # Look up the data source while sample data is generated
+            data_source_future = executor.submit(
+                get_data_source_id, opensearch_ui_endpoint, region, domain_name
             )
-            if not visualization_id:
-                logger.warning("Visualization creation failed, skipping dashboard")
+            
+            sample_documents = []
+            if not domain_endpoint:
+                logger.warning("Domain endpoint not provided, skipping sample data ingestion")
             else:
-                dashboard_id = create_dashboard(
-                    opensearch_ui_endpoint, region, workspace_id, visualization_id
+                sample_documents = generate_sample_metrics(num_docs=50)
+            
+            # Get data source ID for the OpenSearch domain
+            data_source_id = data_source_future.result()
+            if not data_source_id:
+                raise RuntimeError(f"Data source not found for domain: {domain_name}")
+            
+            # Ingest sample data in the background; the domain bulk request
+            # does not depend on any of the UI setup below
+            ingest_future = None
+            if sample_documents:
+                ingest_future = executor.submit(
+                    ingest_sample_data, domain_endpoint, region, sample_documents
                 )
-                if not dashboard_id:
-                    logger.warning("Dashboard creation failed")
+            
+            # Create workspace with data source (idempotent)
+            workspace_id = get_or_create_workspace(
+                opensearch_ui_endpoint, region, data_source_id, workspace_name
+            )
+            if not workspace_id:
+                raise RuntimeError("Failed to get or create workspace")
+            
+            # Create index pattern, visualization, and dashboard
+            dashboard_id = create_dashboard_objects(
+                opensearch_ui_endpoint, region, workspace_id, data_source_id
+            )
+            if not dashboard_id:
+                logger.warning("Dashboard creation failed")
+            
+            if ingest_future and not ingest_future.result():
+                logger.warning("Sample data ingestion failed, but continuing")
         
-        logger.info(f"Lambda execution completed - Workspace: {workspace_id} | Data Source: {data_source_id} | Documents: {len(sample_documents)}")
+        logger.info("Lambda execution completed - Workspace: %s | Data Source: %s | Documents: %s", workspace_id, data_source_id, len(sample_documents))
         
         # Return for Provider Framework - all values must be strings!
         return {
@@ -606,5 +763,5 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         }
         
     except Exception as error:
-        logger.error(f"Lambda execution failed: {str(error)}", exc_info=True)
+        logger.error("Lambda execution failed: %s", error, exc_info=True)
         raise
@@ -10,27 +10,228 @@ CRITICAL Headers:
 - x-amz-content-sha256: Body hash for SigV4
 """
 
+import gzip
 import hashlib
-import json
-from typing import Any, Dict
+import hmac
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, Optional
+from urllib.parse import SplitResult, quote, urlsplit
 
 import boto3
 from botocore.auth import SigV4Auth
-from botocore.awsrequest import AWSRequest
+from botocore.awsrequest import AWSPreparedRequest, AWSRequest
+from botocore.credentials import Credentials
+from botocore.exceptions import NoCredentialsError
 from botocore.httpsession import URLLib3Session
 
+# Shared across requests (and warm Lambda invocations) so the credential chain
+# is resolved once and the HTTPS connection pool is reused
+_SESSION = boto3.Session()
 
-def get_common_headers(body: bytes = b"{}") -> Dict[str, str]:
+# Resolved once at import so worker threads signing requests never walk the
+# credential provider chain on the shared (not thread-safe) Session
+_CREDENTIALS: Optional[Credentials] = _SESSION.get_credentials()
+
+# Connections kept alive per host; sized so concurrent calls don't discard
+# pooled connections and fall back to fresh TLS handshakes
+HTTP_POOL_CONNECTIONS = 32
+
+# URLLib3Session speaks HTTP/1.1 only; concurrency comes from the pool, one
+# connection per in-flight request
+_HTTP = URLLib3Session(max_pool_connections=HTTP_POOL_CONNECTIONS)
+
+
+# Domain request bodies larger than this are sent gzip-compressed
+GZIP_MIN_BODY_BYTES = 1024
+
+# Hash of the default request body, which most GET/list calls send
+EMPTY_BODY = b"{}"
+_EMPTY_BODY_SHA256 = hashlib.sha256(EMPTY_BODY).hexdigest()
+
+
+# Headers replaced on every signing pass, and headers SigV4Auth never signs
+_RESET_HEADERS = frozenset(("authorization", "x-amz-date", "x-amz-security-token"))
+_UNSIGNED_HEADERS = frozenset(("expect", "user-agent", "x-amzn-trace-id"))
+
+
+@lru_cache(maxsize=None)
+def _get_signer(service: str, region: str) -> SigV4Auth:
+    """Return a SigV4 signer for the given service and region."""
+    return SigV4Auth(_CREDENTIALS, service, region)
+
+
+def _hmac_sha256(key: bytes, msg: str) -> bytes:
+    return hmac.new(key, msg.encode("utf-8"), hashlib.sha256).digest()
+
+
+@lru_cache(maxsize=16)
+def _signing_key(secret_key: str, date_stamp: str, region: str, service: str) -> bytes:
+    """
+    Derive the SigV4 signing key for a date/region/service scope.
+    
+    The key only changes with the date or rotated credentials, so it is
+    cached rather than re-derived (four HMACs) for every request.
+    """
+    k_date = _hmac_sha256(f"AWS4{secret_key}".encode("utf-8"), date_stamp)
+    k_region = _hmac_sha256(k_date, region)
+    k_service = _hmac_sha256(k_region, service)
+    return _hmac_sha256(k_service, "aws4_request")
+
+
+def _can_fast_sign(parts: SplitResult) -> bool:
+    """Whether the URL is simple enough for _sign_v4 to canonicalize."""
+    path = parts.path
+    return (
+        parts.port is None
+        and not parts.username
+        and "//" not in path
+        and "/." not in path
+    )
+
+
+def _sign_v4(
+    method: str,
+    parts: SplitResult,
+    headers: Dict[str, str],
+    body: bytes,
+    service: str,
+    region: str,
+    credentials: Credentials,
+) -> Dict[str, str]:
+    """
+    Sign a request with SigV4 and return the headers to send.
+    
+    Produces the same signature as SigV4Auth.add_auth for the requests made
+    by this module, but builds the canonical request directly instead of
+    going through botocore's AWSRequest/HTTPHeaders object graph.
+    
+    Args:
+        method: HTTP method
+        parts: Split request URL (see _can_fast_sign)
+        headers: Request headers
+        body: Request body as bytes
+        service: SigV4 service name ('opensearch' or 'es')
+        region: AWS region
+        credentials: Credentials to sign with
+        
+    Returns:
+        Copy of headers with X-Amz-Date, X-Amz-Security-Token and
+        Authorization set
+    """
+    frozen = credentials.get_frozen_credentials()
+    timestamp = datetime.utcnow().strftime("%Y%m%dT%H%M%SZ")
+    date_stamp = timestamp[:8]
+    
+    signed = {k: v for k, v in headers.items() if k.lower() not in _RESET_HEADERS}
+    signed["X-Amz-Date"] = timestamp
+    if frozen.token:
+        signed["X-Amz-Security-Token"] = frozen.token
+    
+    # Canonical headers: lowercase names, whitespace-collapsed values, host
+    canonical = {"host": parts.hostname}
+    payload_hash = None
+    for name, value in signed.items():
+        lname = name.lower()
+        if lname == "x-amz-content-sha256":
+            payload_hash = value
+        if lname not in _UNSIGNED_HEADERS:
+            canonical[lname] = " ".join(value.split())
+    if payload_hash is None:
+        payload_hash = hashlib.sha256(body).hexdigest()
+    
+    header_names = sorted(canonical)
+    signed_headers = ";".join(header_names)
+    
+    # Query parameters are already URL-encoded; sort them as SigV4Auth does
+    query = "&".join(
+        f"{key}={value}"
+        for key, _, value in sorted(
+            pair.partition("=") for pair in parts.query.split("&") if parts.query
+        )
+    )
+    
+    canonical_request = "\n".join((
+        method.upper(),
+        quote(parts.path or "/", safe="/~"),
+        query,
+        "".join(f"{name}:{canonical[name]}\n" for name in header_names),
+        signed_headers,
+        payload_hash,
+    ))
+    
+    scope = f"{date_stamp}/{region}/{service}/aws4_request"
+    string_to_sign = "\n".join((
+        "AWS4-HMAC-SHA256",
+        timestamp,
+        scope,
+        hashlib.sha256(canonical_request.encode("utf-8")).hexdigest(),
+    ))
+    
+    key = _signing_key(frozen.secret_key, date_stamp, region, service)
+    signature = hmac.new(key, string_to_sign.encode("utf-8"), hashlib.sha256).hexdigest()
+    
+    signed["Authorization"] = (
+        f"AWS4-HMAC-SHA256 Credential={frozen.access_key}/{scope}, "
+        f"SignedHeaders={signed_headers}, Signature={signature}"
+    )
+    return signed
+
+
+def _send_signed(
+    method: str,
+    url: str,
+    headers: Dict[str, str],
+    body: bytes,
+    service: str,
+    region: Optional[str],
+) -> Any:
+    """
+    Sign a request for the given service and send it on the shared session.
+    
+    URLs that need path normalization fall back to botocore's SigV4Auth.
+    """
+    if not region:
+        region = _SESSION.region_name
+    
+    parts = urlsplit(url)
+    if not _can_fast_sign(parts):
+        request = AWSRequest(method=method, url=url, data=body, headers=headers)
+        _get_signer(service, region).add_auth(request)
+        return _HTTP.send(request.prepare())
+    
+    if _CREDENTIALS is None:
+        raise NoCredentialsError()
+    
+    send_headers = _sign_v4(method, parts, headers, body, service, region, _CREDENTIALS)
+    
+    # Match AWSRequestPreparer: unsigned Content-Length for methods with a body
+    if method not in ("GET", "HEAD", "OPTIONS") and not any(
+        k.lower() in ("content-length", "transfer-encoding") for k in send_headers
+    ):
+        send_headers["Content-Length"] = str(len(body))
+    
+    request = AWSPreparedRequest(method, url, send_headers, body or None, False)
+    return _HTTP.send(request)
+
+
+def get_common_headers(body: bytes = EMPTY_BODY) -> Dict[str, str]:
     """
     Get common headers for OpenSearch UI API requests.
     
+    SigV4Auth uses a pre-set x-amz-content-sha256 header as the payload
+    hash, so the body is hashed here once and not again during signing.
+    
     Args:
         body: Request body bytes to hash
         
     Returns:
         Dictionary of required headers
     """
-    body_hash = hashlib.sha256(body).hexdigest()
+    if body == EMPTY_BODY:
+        body_hash = _EMPTY_BODY_SHA256
+    else:
+        body_hash = hashlib.sha256(body).hexdigest()
     return {
         "Content-Type": "application/json",
         "x-amz-content-sha256": body_hash,
@@ -61,20 +262,8 @@ def make_signed_request(
     Returns:
         HTTP response object from URLLib3Session
     """
-    session = boto3.Session()
-    if not region:
-        region = session.region_name
-    
-    # Create AWS request
-    request = AWSRequest(method=method, url=url, data=body, headers=headers)
-    
     # Sign with SigV4 using 'opensearch' service name (not 'es')
-    credentials = session.get_credentials()
-    SigV4Auth(credentials, "opensearch", region).add_auth(request)
-    
-    # Send request using URLLib3Session
-    http_session = URLLib3Session()
-    return http_session.send(request.prepare())
+    return _send_signed(method, url, headers, body, "opensearch", region)
 
 
 def make_domain_request(
@@ -88,6 +277,7 @@ def make_domain_request(
     Make a signed HTTP request to OpenSearch Domain (not UI).
     
     Uses 'es' service name for signing domain requests (different from UI API).
+    Bodies over GZIP_MIN_BODY_BYTES are gzip-compressed before signing.
     
     Args:
         method: HTTP method (GET, POST, PUT, DELETE, etc.)
@@ -99,17 +289,14 @@ def make_domain_request(
     Returns:
         HTTP response object from URLLib3Session
     """
-    session = boto3.Session()
-    if not region:
-        region = session.region_name
-    
-    # Create AWS request
-    request = AWSRequest(method=method, url=url, data=body, headers=headers)
+    # Compress first so the signature covers the bytes actually sent; a
+    # caller-supplied payload hash is of the uncompressed body, so drop it
+    if len(body) > GZIP_MIN_BODY_BYTES:
+        body = gzip.compress(body, compresslevel=1)
+        headers = {
+            k: v for k, v in headers.items() if k.lower() != "x-amz-content-sha256"
+        }
+        headers["Content-Encoding"] = "gzip"
     
     # Sign with SigV4 using 'es' service name for domain requests
-    credentials = session.get_credentials()
-    SigV4Auth(credentials, "es", region).add_auth(request)
-    
-    # Send request using URLLib3Session
-    http_session = URLLib3Session()
-    return http_session.send(request.prepare())
+    return _send_signed(method, url, headers, body, "es", region)
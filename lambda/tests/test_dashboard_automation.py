@@ -0,0 +1,118 @@
+"""Tests for pre-serialized request bodies and saved object creation."""
+
+from unittest import mock
+
+import orjson
+import pytest
+
+import dashboard_automation as da
+
+IDS = [
+    pytest.param("5f3c0b9e-1d2a-4c7e-9a11-22b3c4d5e6f7", id="uuid"),
+    pytest.param('quote"back\\slash\nnewline/é', id="needs-escaping"),
+]
+
+
+def search_source(attributes):
+    return orjson.loads(attributes["kibanaSavedObjectMeta"]["searchSourceJSON"])
+
+
+@pytest.mark.parametrize("object_id", IDS)
+def test_render_index_pattern_body(object_id):
+    body = orjson.loads(da._render(da._INDEX_PATTERN_BODY, da._DATA_SOURCE_ID, object_id))
+    
+    assert body["references"][0]["id"] == object_id
+
+
+@pytest.mark.parametrize("object_id", IDS)
+def test_render_nested_index_pattern_id(object_id):
+    body = orjson.loads(da._render(
+        da._VISUALIZATION_BODY, da._NESTED_INDEX_PATTERN_ID, object_id, depth=2
+    ))
+    
+    assert search_source(body["attributes"])["index"] == object_id
+
+
+@pytest.mark.parametrize("object_id", IDS)
+def test_render_bulk_create_body(object_id):
+    body_bytes = da._BULK_CREATE_BODY
+    for placeholder, depth in (
+        (da._DATA_SOURCE_ID, 1),
+        (da._INDEX_PATTERN_ID, 1),
+        (da._NESTED_INDEX_PATTERN_ID, 2),
+        (da._VISUALIZATION_ID, 1),
+        (da._DASHBOARD_ID, 1),
+    ):
+        body_bytes = da._render(body_bytes, placeholder, object_id, depth)
+    index_pattern, visualization, dashboard = orjson.loads(body_bytes)
+    
+    assert index_pattern["references"][0]["id"] == object_id
+    assert search_source(visualization["attributes"])["index"] == index_pattern["id"]
+    assert dashboard["references"][0]["id"] == visualization["id"]
+
+
+class FakeResponse:
+    def __init__(self, status_code, body):
+        self.status_code = status_code
+        self.content = orjson.dumps(body)
+        self.text = self.content.decode()
+
+
+def test_create_dashboard_objects_returns_dashboard_id_sent():
+    sent = []
+    
+    def fake_request(method, url, headers, body=b"", region=None):
+        objects = orjson.loads(body)
+        sent.append((url, objects))
+        return FakeResponse(200, {"saved_objects": [
+            {"type": obj["type"], "id": obj["id"]} for obj in objects
+        ]})
+    
+    with mock.patch.object(da, "make_signed_request", side_effect=fake_request):
+        dashboard_id = da.create_dashboard_objects("ui.example.com", "us-west-2", "ws-1", "ds-1")
+    
+    assert len(sent) == 1
+    url, (index_pattern, visualization, dashboard) = sent[0]
+    assert url == "https://ui.example.com/w/ws-1/api/saved_objects/_bulk_create"
+    assert dashboard["type"] == "dashboard"
+    assert dashboard_id == dashboard["id"]
+    assert index_pattern["references"][0]["id"] == "ds-1"
+
+
+def test_create_dashboard_objects_fails_on_per_object_error():
+    response = FakeResponse(200, {"saved_objects": [
+        {"type": "index-pattern", "id": "ip-1"},
+        {"type": "visualization", "id": "vis-1"},
+        {"type": "dashboard", "id": "dash-1", "error": {"statusCode": 409, "message": "conflict"}},
+    ]})
+    
+    with mock.patch.object(da, "make_signed_request", return_value=response) as request:
+        dashboard_id = da.create_dashboard_objects("ui.example.com", "us-west-2", "ws-1", "ds-1")
+    
+    assert dashboard_id is None
+    request.assert_called_once()
+
+
+def test_create_dashboard_objects_falls_back_when_bulk_create_missing():
+    calls = []
+    
+    def fake_request(method, url, headers, body=b"", region=None):
+        object_type = url.rsplit("/", 1)[1]
+        calls.append((object_type, orjson.loads(body)))
+        if object_type == "_bulk_create":
+            return FakeResponse(404, {"statusCode": 404})
+        return FakeResponse(200, {"id": f"{object_type}-1"})
+    
+    with mock.patch.object(da, "make_signed_request", side_effect=fake_request):
+        dashboard_id = da.create_dashboard_objects("ui.example.com", "us-west-2", "ws-1", "ds-1")
+    
+    assert dashboard_id == "dashboard-1"
+    assert [object_type for object_type, _ in calls] == [
+        "_bulk_create", "index-pattern", "visualization", "dashboard"
+    ]
+    
+    # Each object references the ID returned for the one created before it
+    _, index_pattern, visualization, dashboard = (body for _, body in calls)
+    assert index_pattern["references"][0]["id"] == "ds-1"
+    assert search_source(visualization["attributes"])["index"] == "index-pattern-1"
+    assert dashboard["references"][0]["id"] == "visualization-1"
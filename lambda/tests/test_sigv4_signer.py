@@ -0,0 +1,203 @@
+"""
+Parity tests for the inlined SigV4 signer.
+
+_sign_v4 must produce exactly the Authorization header botocore's SigV4Auth
+would, so every case is signed both ways with the clock frozen.
+"""
+
+import datetime
+import gzip
+from unittest import mock
+from urllib.parse import urlsplit
+
+import botocore.auth
+import pytest
+from botocore.awsrequest import AWSRequest
+from botocore.credentials import Credentials
+
+import sigv4_signer
+from sigv4_signer import get_common_headers
+
+REGION = "us-west-2"
+UI_HOST = "https://application-app-demo-abc123.us-west-2.opensearch.amazonaws.com"
+DOMAIN_HOST = "https://search-data-source-demo-xyz.us-west-2.es.amazonaws.com"
+BULK_BODY = b'{"index":{"_index":"application-metrics"}}\n{"status_code":200}\n'
+SAVED_OBJECT_BODY = b'{"attributes": {"title":  "application-metrics-*"}}'
+LARGE_BULK_BODY = BULK_BODY * 40
+
+
+class FrozenDatetime(datetime.datetime):
+    @classmethod
+    def utcnow(cls):
+        return cls(2026, 10, 15, 12, 34, 56)
+
+
+CREDENTIALS = [
+    pytest.param(
+        Credentials("AKIDEXAMPLE", "wJalrXUtnFEMI/K7MDENG+bPxRfiCYEXAMPLEKEY"),
+        id="no-token",
+    ),
+    pytest.param(
+        Credentials("ASIAEXAMPLE", "wJalrXUtnFEMI/K7MDENG+bPxRfiCYEXAMPLEKEY", "token/abc=="),
+        id="session-token",
+    ),
+]
+
+SERVICES = ["opensearch", "es"]
+
+REQUESTS = [
+    pytest.param(
+        "GET",
+        f"{UI_HOST}/api/saved_objects/_find"
+        "?type=data-source&search_fields=title&search=%22data-source-demo%22&per_page=10",
+        get_common_headers(),
+        b"",
+        id="get-query",
+    ),
+    pytest.param("GET", f"{DOMAIN_HOST}/", {}, b"", id="get-root"),
+    pytest.param(
+        "POST", f"{UI_HOST}/api/workspaces/_list", get_common_headers(), b"{}", id="post-empty"
+    ),
+    pytest.param(
+        "POST",
+        f"{UI_HOST}/w/ws-1/api/saved_objects/index-pattern",
+        get_common_headers(SAVED_OBJECT_BODY),
+        SAVED_OBJECT_BODY,
+        id="post-body",
+    ),
+    pytest.param(
+        "POST",
+        f"{DOMAIN_HOST}/_bulk?filter_path=errors%2Citems.%2A.error",
+        {"Content-Type": "application/x-ndjson"},
+        BULK_BODY,
+        id="post-query-unhashed-body",
+    ),
+    pytest.param(
+        "POST",
+        f"{UI_HOST}/w/ws~1/api/saved_objects/index-pattern:a%20b",
+        {
+            **get_common_headers(SAVED_OBJECT_BODY),
+            "User-Agent": "dashboard-automation/1.0",
+            "X-Custom-Header": "  spaced    value ",
+        },
+        SAVED_OBJECT_BODY,
+        id="post-encoded-path-extra-headers",
+    ),
+]
+
+FALLBACK_URLS = [
+    pytest.param(f"{DOMAIN_HOST}:8443/_bulk", id="explicit-port"),
+    pytest.param(f"{DOMAIN_HOST}/a/../_bulk", id="dot-segment"),
+    pytest.param(f"{DOMAIN_HOST}//_bulk", id="double-slash"),
+    pytest.param("https://user@search-demo.us-west-2.es.amazonaws.com/_bulk", id="userinfo"),
+]
+
+
+@pytest.fixture(autouse=True)
+def frozen_clock():
+    with mock.patch.object(botocore.auth.datetime, "datetime", FrozenDatetime), \
+            mock.patch.object(sigv4_signer, "datetime", FrozenDatetime):
+        yield
+
+
+def botocore_signed(method, url, headers, body, service, credentials):
+    request = AWSRequest(method=method, url=url, data=body, headers=dict(headers))
+    botocore.auth.SigV4Auth(credentials, service, REGION).add_auth(request)
+    return request.prepare()
+
+
+def sent_request(method, url, headers, body, service, credentials):
+    sent = []
+    with mock.patch.object(sigv4_signer, "_CREDENTIALS", credentials), \
+            mock.patch.object(sigv4_signer, "_get_signer",
+                              lambda svc, region: botocore.auth.SigV4Auth(credentials, svc, region)), \
+            mock.patch.object(sigv4_signer._HTTP, "send", side_effect=sent.append):
+        sigv4_signer._send_signed(method, url, dict(headers), body, service, REGION)
+    return sent[0]
+
+
+@pytest.mark.parametrize("credentials", CREDENTIALS)
+@pytest.mark.parametrize("service", SERVICES)
+@pytest.mark.parametrize("method,url,headers,body", REQUESTS)
+def test_sign_v4_matches_botocore(method, url, headers, body, service, credentials):
+    expected = botocore_signed(method, url, headers, body, service, credentials)
+    signed = sigv4_signer._sign_v4(
+        method, urlsplit(url), dict(headers), body, service, REGION, credentials
+    )
+    
+    assert signed["Authorization"] == expected.headers["Authorization"]
+    assert signed["X-Amz-Date"] == expected.headers["X-Amz-Date"]
+    assert signed.get("X-Amz-Security-Token") == expected.headers.get("X-Amz-Security-Token")
+
+
+@pytest.mark.parametrize("credentials", CREDENTIALS)
+@pytest.mark.parametrize("method,url,headers,body", REQUESTS)
+def test_send_signed_matches_prepared_request(method, url, headers, body, credentials):
+    expected = botocore_signed(method, url, headers, body, "es", credentials)
+    sent = sent_request(method, url, headers, body, "es", credentials)
+    
+    assert dict(sent.headers.items()) == dict(expected.headers.items())
+    assert sent.body == expected.body
+    assert sent.url == expected.url
+
+
+@pytest.mark.parametrize("url", FALLBACK_URLS)
+def test_unnormalized_urls_fall_back_to_botocore(url):
+    credentials = Credentials("AKIDEXAMPLE", "wJalrXUtnFEMI/K7MDENG+bPxRfiCYEXAMPLEKEY")
+    
+    assert not sigv4_signer._can_fast_sign(urlsplit(url))
+    
+    with mock.patch.object(sigv4_signer, "_sign_v4") as fast_signer:
+        sent = sent_request("POST", url, {}, BULK_BODY, "es", credentials)
+    fast_signer.assert_not_called()
+    
+    expected = botocore_signed("POST", url, {}, BULK_BODY, "es", credentials)
+    assert sent.headers["Authorization"] == expected.headers["Authorization"]
+
+
+def domain_request_sent(url, headers, body, credentials):
+    sent = []
+    with mock.patch.object(sigv4_signer, "_CREDENTIALS", credentials), \
+            mock.patch.object(sigv4_signer._HTTP, "send", side_effect=sent.append):
+        sigv4_signer.make_domain_request("POST", url, headers, body, region=REGION)
+    return sent[0]
+
+
+@pytest.mark.parametrize("credentials", CREDENTIALS)
+@pytest.mark.parametrize("headers", [
+    pytest.param({"Content-Type": "application/x-ndjson"}, id="no-payload-hash"),
+    pytest.param(get_common_headers(LARGE_BULK_BODY), id="uncompressed-payload-hash"),
+    pytest.param(
+        {"X-Amz-Content-Sha256": "0" * 64, "Content-Type": "application/x-ndjson"},
+        id="mixed-case-payload-hash",
+    ),
+])
+def test_domain_request_signs_compressed_body(headers, credentials):
+    url = f"{DOMAIN_HOST}/_bulk"
+    original_headers = dict(headers)
+    
+    sent = domain_request_sent(url, headers, LARGE_BULK_BODY, credentials)
+    
+    assert headers == original_headers
+    assert gzip.decompress(sent.body) == LARGE_BULK_BODY
+    assert sent.headers["Content-Encoding"] == "gzip"
+    assert not any(k.lower() == "x-amz-content-sha256" for k in sent.headers)
+    
+    # Signature must cover exactly the compressed bytes and headers sent
+    expected_headers = {
+        k: v for k, v in sent.headers.items()
+        if k not in ("Authorization", "X-Amz-Date", "X-Amz-Security-Token", "Content-Length")
+    }
+    expected = botocore_signed("POST", url, expected_headers, sent.body, "es", credentials)
+    assert dict(sent.headers.items()) == dict(expected.headers.items())
+
+
+def test_domain_request_leaves_small_body_uncompressed():
+    credentials = Credentials("AKIDEXAMPLE", "wJalrXUtnFEMI/K7MDENG+bPxRfiCYEXAMPLEKEY")
+    headers = get_common_headers(BULK_BODY)
+    
+    sent = domain_request_sent(f"{DOMAIN_HOST}/_bulk", headers, BULK_BODY, credentials)
+    
+    assert sent.body == BULK_BODY
+    assert "Content-Encoding" not in sent.headers
+    assert sent.headers["x-amz-content-sha256"] == headers["x-amz-content-sha256"]